@@ -1,12 +1,25 @@
 import asyncio
+import logging
 import os
+from contextlib import aclosing
 from dotenv import load_dotenv
 from pydantic import BaseModel
-from agentic_hustler import Task, Hustle, UniversalLLM, no_gree
+from agentic_hustler import Task, Hustle, UniversalLLM
 
 # 1. Setup
 load_dotenv()
 MODEL_ID = os.getenv("DEFAULT_MODEL") 
+LLM = UniversalLLM() # One client (and connection pool) for every task call
+
+# Static system prompts are built once; only the user turn changes per call
+ANALYST_SYS = {
+    "role": "system",
+    "content": "You are a cynical VC analyst. Find 3 fatal flaws in this idea. Be brief."
+}
+INVESTOR_SYS = {
+    "role": "system",
+    "content": "You are a VC. Based on the analysis, output ONLY 'FUND' or 'PASS'."
+}
 
 # 2. Define the "Papers" (State)
 class VCFirm(BaseModel):
@@ -25,19 +38,12 @@ class PitchDeck(BaseModel):
 class MarketAnalyst(Task[VCFirm, PitchDeck]):
     Requirements = PitchDeck # Auto-validates input
 
-    @no_gree(retries=2)
+    # No @no_gree here: LLM.chat already retries rate limits and outages
     async def run_am(self, deck: PitchDeck):
         print(f"\n🧐 [Analyst] Reviewing '{deck.startup_name}' on {MODEL_ID}...")
         
-        llm = UniversalLLM()
-        return await llm.chat(
-            messages=[{
-                "role": "system", 
-                "content": "You are a cynical VC analyst. Find 3 fatal flaws in this idea. Be brief."
-            }, {
-                "role": "user", 
-                "content": f"Idea: {deck.idea}"
-            }],
+        return await LLM.chat(
+            messages=(ANALYST_SYS, {"role": "user", "content": f"Idea: {deck.idea}"}),
             model=MODEL_ID 
         )
 
@@ -55,22 +61,26 @@ class AngelInvestor(Task[VCFirm, PitchDeck]):
     async def run_am(self, deck: PitchDeck):
         print(f"💰 [Investor] Reading report...")
         
-        llm = UniversalLLM()
-        return await llm.chat(
-            messages=[{
-                "role": "system", 
-                "content": "You are a VC. Based on the analysis, output ONLY 'FUND' or 'PASS'."
-            }, {
-                "role": "user", 
+        # Stream the verdict and hang up as soon as it is known
+        decision = ""
+        async with aclosing(LLM.chat_stream(
+            messages=(INVESTOR_SYS, {
+                "role": "user",
                 "content": f"Idea: {deck.idea}\n\nAnalyst Report: {deck.analysis}"
-            }],
+            }),
             model=MODEL_ID
-        )
+        )) as tokens:
+            async for token in tokens:
+                decision += token
+                if "FUND" in decision.upper() or "PASS" in decision.upper():
+                    break
+        return decision
 
     def deliver_am(self, station, deck, decision):
         station.change.decision = decision
         
         # Update Global Capital
+        # (deliver_am is synchronous, so concurrent pitches can't interleave here)
         if "FUND" in decision.upper():
             station.capital.portfolio.append(deck.startup_name)
             print(f"🚀 [DECISION] {deck.startup_name} -> FUNDED!")
@@ -88,25 +98,29 @@ async def main():
     analyst >> investor
     
     # B. Initialize
-    pipeline = Hustle(start_task=analyst)
+    pipeline = Hustle(start_task=analyst).compile() # Straight line: skip the router
     firm = VCFirm() # Empty portfolio
     
-    # C. Run Pitch #1
+    # C. Run the pitches concurrently (each one is HTTP-bound on the LLM)
     # ✅ CORRECT (Wrap it in the Class)
-    pitch1 = PitchDeck(
-        startup_name="UberForCats",
-        idea="A ride-sharing app where cats drive the cars."
-    )
-    await pipeline.start(firm, pitch1)
-
-    # Do the same for pitch2
-    pitch2 = PitchDeck(
-        startup_name="CureAI",
-        idea="AI that cures baldness using quantum computing."
-    )
-    await pipeline.start(firm, pitch2)
+    pitches = [
+        PitchDeck(
+            startup_name="UberForCats",
+            idea="A ride-sharing app where cats drive the cars."
+        ),
+        PitchDeck(
+            startup_name="CureAI",
+            idea="AI that cures baldness using quantum computing."
+        ),
+    ]
+    await asyncio.gather(*(pipeline.start(firm, pitch) for pitch in pitches))
 
     print(f"\n📂 Final Portfolio: {firm.portfolio}")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    try:
+        from uvloop import run # Optional: pip install agentic_hustler[speedups]
+    except ImportError:
+        from asyncio import run
+    run(main())
\ No newline at end of file
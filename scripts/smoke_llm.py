@@ -0,0 +1,59 @@
+import asyncio
+import os
+from dotenv import load_dotenv
+from agentic_hustler import UniversalLLM
+
+async def main():
+    # Load environment variables
+    load_dotenv()
+    print(f"--- Testing LLM Connection ---")
+    
+    # 1. Check Key
+    key = os.getenv("OPENROUTER_API_KEY")
+    if not key:
+        print("❌ Error: OPENROUTER_API_KEY is missing in .env")
+        return
+    print(f"🔑 Key found: {key[:5]}...{key[-4:]}")
+
+    # 2. Check Model
+    # We use the clean ID from your .env
+    model = os.getenv("DEFAULT_MODEL", "z-ai/glm-4.6")
+    print(f"🤖 Target Model: {model}")
+    
+    # 3. Initialize Adapter
+    llm = UniversalLLM() 
+    
+    # 4. Fire every probe at once; one failure doesn't cancel the others
+    probes = [
+        "Say 'Agentic Hustler is Online' in 3 words.",
+        "Reply with the single word 'pong'.",
+    ]
+    print(f"📡 Sending {len(probes)} requests to OpenRouter...")
+    responses = await asyncio.gather(
+        *(llm.chat(messages=[{"role": "user", "content": p}], model=model) for p in probes),
+        return_exceptions=True
+    )
+    for response in responses:
+        if isinstance(response, Exception):
+            print(f"\n❌ Connection Failed: {response}")
+        else:
+            print(f"\n✨ Success! Model says: {response}")
+
+    # 5. Stream one answer so the first tokens show up straight away
+    print(f"\n🌊 Streaming: ", end="", flush=True)
+    try:
+        async for token in llm.chat_stream(
+            messages=[{"role": "user", "content": "Count from 1 to 10."}],
+            model=model
+        ):
+            print(token, end="", flush=True)
+        print()
+    except Exception as e:
+        print(f"\n❌ Stream Failed: {e}")
+
+if __name__ == "__main__":
+    try:
+        from uvloop import run # Optional: pip install agentic_hustler[speedups]
+    except ImportError:
+        from asyncio import run
+    run(main())
\ No newline at end of file
@@ -5,14 +5,16 @@ agentic_hustler: A minimalist, resilient, async-first workflow engine for AI age
 from .core import (
     DockingStation, 
     Hustle, Task, 
-    no_gree, log_gist
+    no_gree, log_gist,
+    RetryPolicy,
 )
-from .llm import UniversalLLM
+from .llm import UniversalLLM, aclose_clients, reset_state
 
 __all__ = [
     "Hustle",
     "Task",
     "DockingStation",
-    "UniversalLLM",
+    "UniversalLLM", "aclose_clients", "reset_state",
     "no_gree", "log_gist",
+    "RetryPolicy",
 ]
@@ -2,20 +2,49 @@ import copy
 import asyncio
 import logging
 import random
+import weakref
+import itertools
+import openai
+from collections import deque
+from contextvars import ContextVar
 from typing import TypeVar, Generic, Dict, List, Optional, NamedTuple, Any, Type
-from functools import wraps
+from functools import wraps, lru_cache
 from pydantic import BaseModel, ValidationError
 
 # --- Telemetry ---
-logging.basicConfig(level=logging.INFO, format='%(message)s')
+# Applications decide where logs go (e.g. logging.basicConfig); we only emit.
 logger = logging.getLogger("AgenticHustler")
+logger.addHandler(logging.NullHandler())
 
 def log_gist(event, **kwargs):
-    msg = f"[{event}] " + " ".join([f"{k}={v}" for k, v in kwargs.items()])
-    logger.info(msg)
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    fields = " ".join(f"{k}={v}" for k, v in kwargs.items())
+    logger.info("[%s] %s", event, fields, extra={"event": event, "gist": kwargs})
 
 # --- Resilience ---
-def no_gree(retries=3, base_delay=1.0):
+# Failures worth retrying; bad payloads, auth errors and bugs fail fast.
+TRANSIENT_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,  # includes APITimeoutError
+    openai.InternalServerError,
+    ConnectionError,
+    asyncio.TimeoutError,
+)
+# Longest a server-sent Retry-After is honoured before the retry goes ahead anyway
+MAX_RETRY_AFTER = 60.0
+
+def _retry_after(error):
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+def no_gree(retries=3, base_delay=1.0, retry_on=TRANSIENT_ERRORS):
     def decorator(func):
         @wraps(func)
         async def wrapper(self, *args, **kwargs):
@@ -23,19 +52,37 @@ def no_gree(retries=3, base_delay=1.0):
                 try:
                     return await func(self, *args, **kwargs)
                 except Exception as e:
-                    if attempt == retries - 1:
+                    if not isinstance(e, retry_on) or attempt == retries - 1:
                         log_gist("WAHALA", task=self.__class__.__name__, error=str(e))
                         raise e
-                    wait = base_delay * (2 ** attempt) + random.uniform(0, 0.1)
+                    # Full jitter keeps fanned-out retries from landing together
+                    wait = _retry_after(e)
+                    if wait is None:
+                        wait = random.uniform(0, base_delay * (2 ** attempt))
+                    else:
+                        wait = min(max(wait, 0.0), MAX_RETRY_AFTER)
                     log_gist("RETRY", task=self.__class__.__name__, attempt=attempt+1, wait=f"{wait:.2f}s")
                     await asyncio.sleep(wait)
         return wrapper
     return decorator
 
+class RetryPolicy(NamedTuple):
+    retries: int = 3
+    base_delay: float = 1.0
+    retry_on: tuple = TRANSIENT_ERRORS
+
+@lru_cache(maxsize=None)
+def _guarded_run_am(run_am, policy: RetryPolicy):
+    # Wrapped once per (run_am, policy) pair, not on every call
+    return no_gree(*policy)(run_am)
+
 # --- Types ---
 TCapital = TypeVar("TCapital") 
 TChange = TypeVar("TChange")   
 
+# Station tags only need to be unique per process
+_TAG_COUNTER = itertools.count()
+
 class DockingStation(Generic[TCapital, TChange]):
     __slots__ = ['capital', 'change', 'tag']
 
@@ -44,37 +91,49 @@ class DockingStation(Generic[TCapital, TChange]):
         self.change = change
         self.tag = tag
 
-    def undock(self, new_change_data: Optional[Dict] = None) -> 'DockingStation[TCapital, TChange]':
-        new_change = copy.deepcopy(self.change)
-        if isinstance(new_change, dict) and new_change_data:
-            new_change.update(new_change_data) # type: ignore
-        elif isinstance(new_change, BaseModel) and new_change_data:
-            new_change = new_change.model_copy(update=new_change_data)
-        new_tag = f"{self.tag}.{random.randint(100,999)}"
+    def undock(self, new_change_data: Optional[Dict] = None, fork: bool = True) -> 'DockingStation[TCapital, TChange]':
+        # fork=False hands the change over as-is: only safe when nobody else keeps it
+        if isinstance(self.change, BaseModel) and self.change.model_config.get("frozen"):
+            # Frozen changes are shared as-is; CONVENTIONS.md requires their fields to be immutable too
+            new_change = self.change.model_copy(update=new_change_data) if new_change_data else self.change
+        elif isinstance(self.change, BaseModel):
+            new_change = self.change.model_copy(update=new_change_data or {}, deep=fork)
+        elif fork:
+            new_change = copy.deepcopy(self.change)
+            if isinstance(new_change, dict) and new_change_data:
+                new_change.update(new_change_data) # type: ignore
+        elif isinstance(self.change, dict) and new_change_data:
+            new_change = {**self.change, **new_change_data}
+        else:
+            new_change = self.change
+        new_tag = f"{self.tag}.{next(_TAG_COUNTER)}"
         return DockingStation(self.capital, new_change, tag=new_tag)
 
 class NextMove(NamedTuple):
     route: str
     payload: Optional[Dict[str, Any]] = None
 
+# Moves requested by the Task execution running in the current context
+_MOVES: ContextVar[Optional[List[NextMove]]] = ContextVar("agentic_hustler_moves", default=None)
+
 # --- The Task (Strictly 2 Generics) ---
 class Task(Generic[TCapital, TChange]):
     Requirements: Optional[Type[BaseModel]] = None
+    retry_policy: Optional[RetryPolicy] = None
 
     def __init__(self):
         self._connections: Dict[str, 'Task'] = {}
-        self._moves: List[NextMove] = []
 
     def check_am(self, station: DockingStation[TCapital, TChange]) -> Any:
         if self.Requirements and isinstance(station.change, dict):
             try:
-                return self.Requirements(**station.change)
+                # model_validate goes straight to the compiled pydantic-core validator
+                return self.Requirements.model_validate(station.change)
             except ValidationError as e:
                 log_gist("BAD_PAYLOAD", tag=station.tag, error=str(e))
                 raise e
         return station.change
 
-    @no_gree(retries=3)
     async def run_am(self, specs: Any) -> Any:
         return specs
 
@@ -82,7 +141,10 @@ class Task(Generic[TCapital, TChange]):
         pass
 
     def next_task(self, route_name="forward", payload=None):
-        self._moves.append(NextMove(route_name, payload))
+        moves = _MOVES.get()
+        if moves is None:
+            raise RuntimeError("next_task() can only be called from run_am() or deliver_am()")
+        moves.append(NextMove(route_name, payload))
 
     def link(self, route_name, next_task_instance):
         self._connections[route_name] = next_task_instance
@@ -92,34 +154,100 @@ class Task(Generic[TCapital, TChange]):
         return self.link("forward", other_task)
 
     async def _execute(self, station: DockingStation[TCapital, TChange]) -> List[NextMove]:
-        self._moves = []
         specs = self.check_am(station)
         log_gist("START_OP", task=self.__class__.__name__, tag=station.tag)
-        output = await self.run_am(specs)
-        self.deliver_am(station, specs, output)
+        # Every execution collects its own moves, so concurrent stations running
+        # through the same Task never see each other's moves.
+        moves: List[NextMove] = []
+        token = _MOVES.set(moves)
+        try:
+            policy = self.retry_policy
+            if policy:
+                output = await _guarded_run_am(type(self).run_am, policy)(self, specs)
+            else:
+                output = await self.run_am(specs)
+            self.deliver_am(station, specs, output)
+        finally:
+            _MOVES.reset(token)
         log_gist("OP_COMPLETE", task=self.__class__.__name__, tag=station.tag)
-        if not self._moves:
+        if not moves:
             return [NextMove("forward", None)]
-        return self._moves
+        return moves
 
 class Hustle(Generic[TCapital, TChange]):
-    def __init__(self, start_task: Task[TCapital, TChange]):
-        # 🔴 WAS: self.start = start_task  (This caused the bug)
-        # 🟢 CHANGE TO:
+    def __init__(self, start_task: Task[TCapital, TChange], max_concurrency: int = 8):
         self.entry_task = start_task
+        self.max_concurrency = max_concurrency
+        self._sem: Optional[asyncio.BoundedSemaphore] = None
+        self._sem_loop = None
+        self._plan: Optional[tuple] = None
+
+    def _loop_sem(self) -> asyncio.BoundedSemaphore:
+        # Caps how many stations are inside a Task at once (fan-out safety vs 429s).
+        # A contended semaphore is bound to its loop, so each loop gets its own.
+        loop = asyncio.get_running_loop()
+        if self._sem is None or self._sem_loop() is not loop:
+            self._sem = asyncio.BoundedSemaphore(self.max_concurrency)
+            self._sem_loop = weakref.ref(loop)
+        return self._sem
+
+    async def _run_one(self, task: Task[TCapital, TChange], station: DockingStation[TCapital, TChange]):
+        async with self._loop_sem():
+            moves = await task._execute(station)
+        routed = [m for m in moves if m.route in task._connections]
+        # A single successor can take over the change; only real branches need copies
+        fork = len(routed) > 1
+        return [(task._connections[m.route], station.undock(m.payload, fork=fork)) for m in routed]
+
+    def compile(self) -> 'Hustle[TCapital, TChange]':
+        """Freezes a straight forward-only graph into a plan that runs without per-hop scheduling.
+
+        Call it after wiring; graphs with named routes or cycles keep using the router.
+        """
+        plan, task, seen = [], self.entry_task, set()
+        while task is not None:
+            if id(task) in seen or set(task._connections) - {"forward"}:
+                self._plan = None
+                return self
+            seen.add(id(task))
+            plan.append(task)
+            task = task._connections.get("forward")
+        self._plan = tuple(plan)
+        return self
+
+    async def _run_plan(self, station: DockingStation[TCapital, TChange]):
+        for task in self._plan:
+            next_stops = await self._run_one(task, station)
+            if len(next_stops) != 1:
+                # Finished, or a task fanned out at runtime: the router takes it from here
+                await self._drive(deque(next_stops))
+                return
+            _, station = next_stops[0]
 
     async def start(self, initial_capital: TCapital, initial_change: TChange):
         first_station = DockingStation(initial_capital, initial_change)
-        
-        # 🔴 WAS: queue = [(self.start, first_station)]
-        # 🟢 CHANGE TO:
-        queue = [(self.entry_task, first_station)]
-        
-        while queue:
-            current_task, current_station = queue.pop(0)
-            moves = await current_task._execute(current_station)
-            for m in moves:
-                if m.route in current_task._connections:
-                    next_task_instance = current_task._connections[m.route]
-                    new_station = current_station.undock(m.payload)
-                    queue.append((next_task_instance, new_station))
+        if self._plan:
+            await self._run_plan(first_station)
+        else:
+            await self._drive(deque([(self.entry_task, first_station)]))
+
+    async def _drive(self, queue):
+        pending = set()
+        try:
+            while queue or pending:
+                while queue:
+                    task, station = queue.popleft()
+                    pending.add(asyncio.create_task(self._run_one(task, station)))
+                # Handle whichever station lands first so a slow one doesn't hold the line
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Read every finished station (so no error goes unretrieved) before failing
+                errors = [finished.exception() for finished in done if finished.exception()]
+                if errors:
+                    raise errors[0]
+                for finished in done:
+                    queue.extend(finished.result())
+        finally:
+            for straggler in pending:
+                straggler.cancel()
+            # Let cancelled stations finish their cleanup before start() returns or raises
+            await asyncio.gather(*pending, return_exceptions=True)
@@ -1,44 +1,659 @@
 import os
+import json
+import time
+import shelve
+import asyncio
+import hashlib
+import importlib.util
+import weakref
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache, partial
+import httpx
+import openai
+from dotenv import find_dotenv, load_dotenv
+from .core import no_gree
 from openai import AsyncOpenAI
-from typing import List, Dict
+from typing import List, Dict, Optional, AsyncIterator, Sequence, Tuple, Union, Callable, Awaitable
+
+try:
+    import orjson
+except ImportError:  # optional: pip install agentic_hustler[speedups]
+    orjson = None
+
+try:
+    import aiohttp
+except ImportError:  # optional: pip install agentic_hustler[speedups]
+    aiohttp = None
+
+def _dumps(obj, sort_keys=False) -> bytes:
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+    # Raw UTF-8 like orjson, so size-based token estimates don't depend on the extras
+    return json.dumps(obj, sort_keys=sort_keys, separators=(",", ":"), ensure_ascii=False).encode()
+
+def _canonical(obj) -> bytes:
+    # Always the stdlib encoder: orjson formats some floats differently (1e-7 vs 1e-07),
+    # and a cache key must not change with the installed extras
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode()
+
+def _loads(data):
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def _status_error(status: int, headers, content: bytes, url: str) -> openai.APIStatusError:
+    """Maps a raw HTTP error onto the openai exception the SDK would have raised."""
+    response = httpx.Response(status, headers=dict(headers), content=content, request=httpx.Request("POST", url))
+    if status == 429:
+        error_cls = openai.RateLimitError
+    elif status >= 500:
+        error_cls = openai.InternalServerError
+    else:
+        error_cls = openai.APIStatusError
+    try:
+        body = _loads(content)
+    except ValueError:
+        body = None
+    return error_cls(f"Error code: {status}", response=response, body=body)
+
+_OPENROUTER_HEADERS = {
+    "HTTP-Referer": "https://localhost",
+    "X-Title": "AgenticHustler",
+}
+
+_DOTENV_LOADED = False
+
+def _ensure_env():
+    # .env is parsed at most once per process, however many callers ask
+    global _DOTENV_LOADED
+    if _DOTENV_LOADED:
+        return
+    # Search from the working directory, not from wherever the package is installed
+    load_dotenv(find_dotenv(usecwd=True))
+    _DOTENV_LOADED = True
+
+@dataclass(frozen=True)
+class EnvConfig:
+    """Tuning knobs read from the environment; provider keys are looked up live instead."""
+    rpm: float
+    tpm: float
+    max_concurrency: int
+    max_connections: int
+    custom_url: Optional[str]
+
+@lru_cache(maxsize=1)
+def _env_config() -> EnvConfig:
+    # Read once per process; call _env_config.cache_clear() after changing these vars
+    _ensure_env()
+    return EnvConfig(
+        rpm=float(os.getenv("LLM_RPM", 0)),
+        tpm=float(os.getenv("LLM_TPM", 0)),
+        max_concurrency=int(os.getenv("LLM_MAX_CONCURRENCY", 32)),
+        max_connections=int(os.getenv("OPENROUTER_MAX_CONNS", 512)),
+        custom_url=os.getenv("CUSTOM_LLM_URL"),
+    )
+
+# Connection pools are bound to the event loop that first used them, so clients are
+# cached per running loop rather than once per process. Several of them hold a reference
+# back to their loop, so the weak key alone never frees a scope: _scope_keeper closes and
+# drops it when the loop shuts down (asyncio.run() does this), or on aclose_clients().
+_LOOP_SCOPES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict]" = weakref.WeakKeyDictionary()
+
+def _loop_scope() -> Dict:
+    loop = asyncio.get_running_loop()
+    scope = _LOOP_SCOPES.get(loop)
+    if scope is None:
+        scope = _LOOP_SCOPES[loop] = {}
+        keeper = scope["keeper"] = _scope_keeper(scope)
+        # Step it to its yield: the loop now tracks it and closes it in shutdown_asyncgens()
+        try:
+            keeper.asend(None).send(None)
+        except StopIteration:
+            pass
+    return scope
+
+async def _scope_keeper(scope: Dict):
+    try:
+        yield
+    finally:
+        loop = asyncio.get_running_loop()
+        if _LOOP_SCOPES.get(loop) is scope:
+            del _LOOP_SCOPES[loop]
+        for resource in scope.values():
+            if isinstance(resource, httpx.AsyncClient):
+                await resource.aclose()
+            elif isinstance(resource, _LoopState) and resource.aio is not None and not resource.aio.closed:
+                await resource.aio.close()
+
+def _new_http_client() -> httpx.AsyncClient:
+    max_conns = _env_config().max_connections
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=max_conns, max_keepalive_connections=max_conns),
+        http2=importlib.util.find_spec("h2") is not None, # Multiplexing needs the optional h2 package
+    )
+
+def _get_http_client() -> httpx.AsyncClient:
+    # Shared by every endpoint on this loop; httpx keeps a separate pool per origin anyway
+    scope = _loop_scope()
+    if "http" not in scope:
+        scope["http"] = _new_http_client()
+    return scope["http"]
+
+def _get_async_client(provider: str, api_key: Optional[str], base_url: Optional[str], sdk_retries=True) -> AsyncOpenAI:
+    # One client per endpoint on this loop, plus a no-retry twin for paths no_gree already retries
+    scope = _loop_scope()
+    key = ("openai", provider, api_key, base_url)
+    if key not in scope:
+        scope[key] = AsyncOpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            default_headers=_OPENROUTER_HEADERS if provider == "openrouter" else None,
+            http_client=_get_http_client(),
+        )
+    if sdk_retries:
+        return scope[key]
+    bare_key = key + ("no-retries",)
+    if bare_key not in scope:
+        scope[bare_key] = scope[key].with_options(max_retries=0)
+    return scope[bare_key]
+
+async def aclose_clients():
+    """Closes the HTTP clients and aiohttp sessions opened on the running event loop.
+
+    Call it at the end of the coroutine passed to asyncio.run(); the next loop starts
+    with fresh clients either way, this just releases the sockets promptly.
+    """
+    scope = _LOOP_SCOPES.get(asyncio.get_running_loop())
+    if scope is not None:
+        await scope["keeper"].aclose()
+
+def reset_state():
+    """Forgets every cached adapter, client and setting, as if the process had just started.
+
+    For tests and notebooks that change provider env vars or .env between runs. Sockets
+    are dropped, not closed: await aclose_clients() first on a loop you still own.
+    """
+    global _DOTENV_LOADED
+    UniversalLLM._instances.clear()
+    _LOOP_SCOPES.clear()
+    _env_config.cache_clear()
+    _resolve_credentials.cache_clear()
+    _DOTENV_LOADED = False
+
+@dataclass(frozen=True, slots=True)
+class ChatResult:
+    """The few completion fields callers actually read, without the SDK's model tree."""
+    content: Optional[str]
+    finish_reason: Optional[str]
+    usage: Optional[Dict]
+
+class RateLimiter:
+    """Client-side token bucket for requests/min and tokens/min."""
+
+    def __init__(self, rpm: Optional[float] = None, tpm: Optional[float] = None):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.request_capacity = float(rpm or 0)
+        self.token_capacity = float(tpm or 0)
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self.last_refill
+        self.last_refill = now
+        if self.rpm:
+            self.request_capacity = min(self.rpm, self.request_capacity + self.rpm * elapsed / 60)
+        if self.tpm:
+            self.token_capacity = min(self.tpm, self.token_capacity + self.tpm * elapsed / 60)
+
+    async def acquire(self, est_tokens: int = 0):
+        # Waiters queue on the lock, so the bucket is handed out first come first served
+        async with self._lock:
+            while True:
+                self._refill()
+                waits = [0.0]
+                if self.rpm and self.request_capacity < 1:
+                    waits.append((1 - self.request_capacity) * 60 / self.rpm)
+                if self.tpm and self.token_capacity < min(est_tokens, self.tpm):
+                    waits.append((min(est_tokens, self.tpm) - self.token_capacity) * 60 / self.tpm)
+                if max(waits) == 0:
+                    break
+                await asyncio.sleep(max(waits))
+            if self.rpm:
+                self.request_capacity -= 1
+            if self.tpm:
+                self.token_capacity -= est_tokens
+
+    def reconcile(self, est_tokens: int, actual_tokens: int):
+        if self.tpm:
+            self.token_capacity -= actual_tokens - est_tokens
+
+    def settle(self, headers, data: Dict, est_tokens: int):
+        self.sync_headers(headers)
+        if data.get("usage"):
+            self.reconcile(est_tokens, data["usage"]["total_tokens"])
+
+    def sync_headers(self, headers):
+        # Trust the provider when it says we have less room than we think
+        remaining_requests = headers.get("x-ratelimit-remaining-requests")
+        remaining_tokens = headers.get("x-ratelimit-remaining-tokens")
+        try:
+            if self.rpm and remaining_requests is not None:
+                self.request_capacity = min(self.request_capacity, float(remaining_requests))
+            if self.tpm and remaining_tokens is not None:
+                self.token_capacity = min(self.token_capacity, float(remaining_tokens))
+        except ValueError:
+            pass
+
+class _LoopState:
+    """An adapter's asyncio primitives and aiohttp session, which only work on the loop that made them."""
+    __slots__ = ("sem", "limiter", "inflight", "aio")
+
+    def __init__(self, max_concurrency: int, rpm: Optional[float], tpm: Optional[float]):
+        # Caps in-flight requests even when no RPM/TPM budget is configured
+        self.sem = asyncio.Semaphore(max_concurrency)
+        self.limiter = RateLimiter(rpm, tpm) if (rpm or tpm) else None
+        self.inflight: Dict[str, asyncio.Future] = {}
+        self.aio = None
+
+class ResponseCache:
+    """Exact-match LRU of chat answers with a TTL, optionally backed by a shelve file on disk."""
+
+    def __init__(self, maxsize: int = 4096, ttl: Optional[float] = 3600, path: Optional[str] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.path = path
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._disk_lock = threading.Lock()
+
+    @staticmethod
+    def key(model: str, temperature, messages, params: Optional[Dict] = None) -> str:
+        # Extra params only join the key when given
+        blob = _canonical([model, temperature, messages, *([params] if params else [])])
+        # One digest everywhere, so a shelve keeps hitting whichever extras are installed
+        return hashlib.blake2b(blob, digest_size=16).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._memory.get(key)
+        if entry is None and self.path:
+            entry = await asyncio.to_thread(self._disk_get, key)
+        if not isinstance(entry, tuple): # missing, or written before entries carried a TTL
+            return None
+        expires_at, value = entry
+        if expires_at < time.time():
+            self._memory.pop(key, None)
+            return None
+        self._remember(key, entry)
+        return value
+
+    async def set(self, key: str, value: str):
+        expires_at = time.time() + self.ttl if self.ttl else float("inf")
+        entry = (expires_at, value)
+        self._remember(key, entry)
+        if self.path:
+            await asyncio.to_thread(self._disk_set, key, entry)
+
+    # shelve is blocking and not safe for concurrent writers: run it in a thread, one at a time
+    def _disk_get(self, key: str):
+        with self._disk_lock, shelve.open(self.path) as db:
+            return db.get(key)
+
+    def _disk_set(self, key: str, entry: Tuple[float, str]):
+        with self._disk_lock, shelve.open(self.path) as db:
+            db[key] = entry
+
+    def _remember(self, key: str, entry: Tuple[float, str]):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+@lru_cache(maxsize=32)
+def _resolve_credentials(provider: str) -> Tuple[str, str]:
+    # Looked up and checked once per provider; tests can cache_clear()
+    api_key = UniversalLLM._get_key(provider)
+    if not api_key:
+        env_var = UniversalLLM._KEY_ENV.get(provider, f"{provider.upper()}_API_KEY")
+        raise ValueError(f"API key for '{provider}' not found (set {env_var})")
+    base_url = UniversalLLM._get_url(provider)
+    if not base_url:
+        # Without a URL the SDK would fall back to api.openai.com and send it this key
+        raise ValueError(f"No base URL for provider '{provider}' (set CUSTOM_LLM_URL)")
+    return api_key, base_url
 
 class UniversalLLM:
-    def __init__(self, provider="openrouter"):
+    _URLS = {
+        "openrouter": "https://openrouter.ai/api/v1",
+        "openai": "https://api.openai.com/v1",
+        "ollama": "http://localhost:11434/v1",
+    }
+    _KEY_ENV = {
+        "openrouter": "OPENROUTER_API_KEY",
+        "openai": "OPENAI_API_KEY",
+    }
+    _FIXED_KEYS = {"ollama": "ollama"}
+    # One adapter per configuration, so call sites share its semaphore, bucket and cache
+    _instances: Dict[tuple, "UniversalLLM"] = {}
+
+    def __new__(
+        cls,
+        provider="openrouter",
+        rpm: Optional[float] = None,
+        tpm: Optional[float] = None,
+        cache: bool = False,
+        cache_ttl: Optional[float] = 3600,
+        cache_path: Optional[str] = None,
+    ):
+        key = (cls, provider, rpm, tpm, cache, cache_ttl, cache_path)
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instances[key] = instance
+        return instance
+
+    def __init__(
+        self,
+        provider="openrouter",
+        rpm: Optional[float] = None,
+        tpm: Optional[float] = None,
+        cache: bool = False,
+        cache_ttl: Optional[float] = 3600,
+        cache_path: Optional[str] = None,
+    ):
+        if getattr(self, "_inited", False):
+            return
         self.provider = provider
-        self.api_key = self._get_key(provider)
-        self.base_url = self._get_url(provider)
-        
-        self.headers = None
-        if provider == "openrouter":
-            self.headers = {
-                "HTTP-Referer": "https://localhost",
-                "X-Title": "AgenticHustler",
-            }
-
-        self.client = AsyncOpenAI(
-            api_key=self.api_key,
-            base_url=self.base_url,
-            default_headers=self.headers
-        )
+        self.api_key, self.base_url = _resolve_credentials(provider)
+        self.headers = _OPENROUTER_HEADERS if provider == "openrouter" else None
+        env = _env_config()
+        self._rpm = rpm or env.rpm or None
+        self._tpm = tpm or env.tpm or None
+        self._cache = ResponseCache(ttl=cache_ttl, path=cache_path) if cache else None
+        self._warmup_task = None
+        try:
+            # Open the TLS connection while the app is still starting up
+            self._warmup_task = asyncio.get_running_loop().create_task(self._warmup())
+        except RuntimeError:
+            pass # No running loop (e.g. module scope): the first request pays the handshake
+        self._inited = True
+
+    @property
+    def client(self) -> AsyncOpenAI:
+        """The SDK client for the running event loop."""
+        return _get_async_client(self.provider, self.api_key, self.base_url)
+
+    @property
+    def _bare_client(self) -> AsyncOpenAI:
+        # For _complete only: no_gree retries it, so the SDK's own retries would stack on top
+        return _get_async_client(self.provider, self.api_key, self.base_url, sdk_retries=False)
+
+    def _loop_state(self) -> _LoopState:
+        # The singleton outlives event loops; its semaphore, bucket and session must not
+        scope = _loop_scope()
+        state = scope.get(self)
+        if state is None:
+            state = scope[self] = _LoopState(_env_config().max_concurrency, self._rpm, self._tpm)
+        return state
+
+    @property
+    def _sem(self) -> asyncio.Semaphore:
+        return self._loop_state().sem
 
-    def _get_url(self, provider):
-        if provider == "openrouter": return "https://openrouter.ai/api/v1"
-        if provider == "openai": return "https://api.openai.com/v1"
-        if provider == "ollama": return "http://localhost:11434/v1"
-        return os.getenv("CUSTOM_LLM_URL")
+    @property
+    def _limiter(self) -> Optional[RateLimiter]:
+        return self._loop_state().limiter
 
-    def _get_key(self, provider):
-        if provider == "ollama": return "ollama"
-        if provider == "openrouter": return os.getenv("OPENROUTER_API_KEY")
-        return os.getenv(f"{provider.upper()}_API_KEY")
+    @property
+    def _inflight(self) -> Dict[str, asyncio.Future]:
+        return self._loop_state().inflight
 
-    async def chat(self, messages: List[Dict], model: str, temperature=0.7):
+    async def _warmup(self):
+        if not self.base_url:
+            return
         try:
-            response = await self.client.chat.completions.create(
+            # Same pool the SDK uses, so the live socket is reused by the first chat()
+            await _get_http_client().head(self.base_url, timeout=5)
+        except httpx.HTTPError:
+            pass
+
+    @classmethod
+    def _get_url(cls, provider):
+        return cls._URLS.get(provider) or _env_config().custom_url
+
+    @classmethod
+    def _get_key(cls, provider):
+        if provider in cls._FIXED_KEYS:
+            return cls._FIXED_KEYS[provider]
+        _ensure_env()
+        return os.getenv(cls._KEY_ENV.get(provider, f"{provider.upper()}_API_KEY"))
+
+    @no_gree(retries=3, base_delay=0.5)
+    async def _complete(self, messages: Sequence[Dict], model: str, temperature=0.7, **params):
+        est_tokens = len(_dumps(messages)) // 4
+        if self._limiter:
+            await self._limiter.acquire(est_tokens)
+        async with self._sem:
+            raw = await self._bare_client.chat.completions.with_raw_response.create(
                 model=model,
                 messages=messages,
-                temperature=temperature
+                temperature=temperature,
+                **params
+            )
+        # Read the JSON ourselves instead of building the SDK's full pydantic tree
+        data = _loads(raw.content)
+        if self._limiter:
+            self._limiter.settle(raw.headers, data, est_tokens)
+        return data
+
+    def _aio_session(self):
+        if aiohttp is None:
+            raise ImportError("araw() needs aiohttp: pip install agentic_hustler[speedups]")
+        state = self._loop_state()
+        if state.aio is None or state.aio.closed:
+            state.aio = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=256, ttl_dns_cache=300),
+                headers={"Authorization": f"Bearer {self.api_key}", **(self.headers or {})}
             )
-            return response.choices[0].message.content
+        return state.aio
+
+    @staticmethod
+    def encode_messages(messages: Sequence[Dict]) -> bytes:
+        """Pre-encodes a message list once so araw() can reuse it without re-serializing."""
+        return _dumps(messages)
+
+    async def araw(self, messages: Union[Sequence[Dict], bytes], model: str, temperature=0.7, **params) -> Dict:
+        """Posts straight to /chat/completions, skipping the SDK, and returns the JSON body as a dict.
+
+        `messages` may be the bytes from encode_messages(); they are spliced into the body as-is.
+        """
+        session = self._aio_session()
+        if not isinstance(messages, bytes):
+            messages = _dumps(messages)
+        body = _dumps({"model": model, "temperature": temperature, **params})[:-1] + b',"messages":' + messages + b"}"
+        est_tokens = len(messages) // 4
+        if self._limiter:
+            await self._limiter.acquire(est_tokens)
+        url = f"{self.base_url}/chat/completions"
+        async with self._sem:
+            try:
+                async with session.post(url, data=body, headers={"Content-Type": "application/json"}) as r:
+                    status, headers, content = r.status, r.headers, await r.read()
+            except aiohttp.ClientConnectionError as e:
+                # Same error types as the SDK path, so no_gree retries the fast path too
+                raise openai.APIConnectionError(request=httpx.Request("POST", url)) from e
+        if status >= 400:
+            raise _status_error(status, headers, content, url)
+        data = _loads(content)
+        if self._limiter:
+            self._limiter.settle(headers, data, est_tokens)
+        return data
+
+    async def aclose(self):
+        """Closes the aiohttp session araw() opened on the running loop, if any."""
+        state = _loop_scope().get(self)
+        if state is not None and state.aio is not None and not state.aio.closed:
+            await state.aio.close()
+
+    async def chat(self, messages: Sequence[Dict], model: str, temperature=0.7, **params):
+        try:
+            if self._cache or temperature == 0:
+                key = ResponseCache.key(model, temperature, messages, params)
+            if self._cache:
+                hit = await self._cache.get(key)
+                if hit is not None:
+                    return hit
+            if temperature == 0:
+                # Deterministic twins already on the wire share that one request
+                call = self._inflight.get(key)
+                if call is None:
+                    call = asyncio.ensure_future(self._complete(messages, model, temperature, **params))
+                    self._inflight[key] = call
+                    call.add_done_callback(lambda _: self._inflight.pop(key, None))
+                data = await asyncio.shield(call)
+            else:
+                data = await self._complete(messages, model, temperature, **params)
+            content = data["choices"][0]["message"]["content"]
+            if self._cache and content is not None:
+                await self._cache.set(key, content)
+            return content
         except Exception as e:
             raise e
+
+    def bind(self, *, model: str, temperature=0.7, **params) -> Callable[..., Awaitable[Optional[str]]]:
+        """Pins model, sampling and any extra request params once; the result is called as `await call(messages)`."""
+        return partial(self.chat, model=model, temperature=temperature, **params)
+
+    async def chat_meta(self, messages: Sequence[Dict], model: str, temperature=0.7) -> ChatResult:
+        data = await self._complete(messages, model, temperature)
+        choice = data["choices"][0]
+        return ChatResult(
+            content=choice["message"]["content"],
+            finish_reason=choice.get("finish_reason"),
+            usage=data.get("usage"),
+        )
+
+    async def chat_stream(self, messages: Sequence[Dict], model: str, temperature=0.7) -> AsyncIterator[str]:
+        """Yields the answer as it is generated; close the generator to stop early."""
+        if self._limiter:
+            await self._limiter.acquire(len(_dumps(messages)) // 4)
+        async with self._sem:
+            stream = await self.client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                stream=True
+            )
+            try:
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+            finally:
+                await stream.close()
+
+    async def chat_many(self, batch: Sequence[Sequence[Dict]], model: str, temperature=0.7) -> List[str]:
+        """Answers every conversation in `batch`; results line up with the input order."""
+        # Identical conversations share one request (and one RPM slot) via `n`
+        groups: Dict[bytes, List[int]] = {}
+        for i, messages in enumerate(batch):
+            groups.setdefault(_dumps(messages, sort_keys=True), []).append(i)
+
+        results: List[Optional[str]] = [None] * len(batch)
+
+        async def run_group(indices: List[int]):
+            messages = batch[indices[0]]
+            if len(indices) == 1:
+                results[indices[0]] = await self.chat(messages, model, temperature)
+                return
+            data = await self._complete(messages, model, temperature, n=len(indices))
+            choices = sorted(data["choices"], key=lambda c: c["index"])
+            for i, choice in zip(indices, choices):
+                results[i] = choice["message"]["content"]
+            # Some providers ignore `n`; ask again for whatever came back short
+            for i in indices[len(choices):]:
+                results[i] = await self.chat(messages, model, temperature)
+
+        await asyncio.gather(*(run_group(indices) for indices in groups.values()))
+        return results
+
+    async def complete_many(self, prompts: Sequence[str], model: str, batch_size=10, **params) -> List[str]:
+        """Sends plain prompts to the completions endpoint, `batch_size` per request; results keep input order."""
+        if params.get("n", 1) != 1:
+            # Choice indexes would no longer line up with prompts
+            raise ValueError("complete_many() returns one text per prompt; n is not supported")
+        async def run_chunk(chunk: Sequence[str]) -> List[str]:
+            est_tokens = len(_dumps(list(chunk))) // 4
+            if self._limiter:
+                await self._limiter.acquire(est_tokens)
+            async with self._sem:
+                raw = await self.client.completions.with_raw_response.create(
+                    model=model,
+                    prompt=list(chunk),
+                    **params
+                )
+            data = _loads(raw.content)
+            if self._limiter:
+                self._limiter.settle(raw.headers, data, est_tokens)
+            texts = [""] * len(chunk)
+            for choice in data["choices"]:
+                texts[choice["index"]] = choice["text"]
+            return texts
+
+        chunks = [prompts[i:i + batch_size] for i in range(0, len(prompts), batch_size)]
+        answers = await asyncio.gather(*(run_chunk(chunk) for chunk in chunks))
+        return [text for texts in answers for text in texts]
+
+    async def batch_submit(self, jobs: Sequence[Sequence[Dict]], model: str, temperature=0.7) -> str:
+        """Uploads `jobs` to the provider's Batch API and returns the batch id."""
+        lines = [
+            _dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {"model": model, "messages": messages, "temperature": temperature},
+            })
+            for i, messages in enumerate(jobs)
+        ]
+        batch_file = await self.client.files.create(
+            file=("hustle_batch.jsonl", b"\n".join(lines)),
+            purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        return batch.id
+
+    async def batch_poll(self, batch_id: str, base_delay=5.0, max_delay=300.0) -> List[Optional[str]]:
+        """Waits for a batch to finish; results line up with the submitted jobs (None if a job failed)."""
+        delay = base_delay
+        while True:
+            batch = await self.client.batches.retrieve(batch_id)
+            if batch.status == "completed":
+                break
+            if batch.status in ("failed", "expired", "cancelled"):
+                raise RuntimeError(f"Batch {batch_id} ended with status '{batch.status}'")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_delay)
+
+        rows = await self._batch_rows(batch.output_file_id)
+        counts = batch.request_counts
+        if counts is not None:
+            size = counts.total
+        else:
+            # Some providers omit request_counts: size from the highest job id any file mentions
+            failed = await self._batch_rows(batch.error_file_id)
+            size = max((int(row["custom_id"]) + 1 for row in rows + failed), default=0)
+        results: List[Optional[str]] = [None] * size
+        for row in rows:
+            body = (row.get("response") or {}).get("body") or {}
+            if body.get("choices"):
+                results[int(row["custom_id"])] = body["choices"][0]["message"]["content"]
+        return results
+
+    async def _batch_rows(self, file_id: Optional[str]) -> List[Dict]:
+        if not file_id:
+            return []
+        output = await self.client.files.content(file_id)
+        return [_loads(line) for line in output.text.splitlines() if line.strip()]
@@ -0,0 +1,30 @@
+import httpx
+import pytest
+from agentic_hustler import llm
+
+COMPLETION = {
+    "id": "chatcmpl-test",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "test-model",
+    "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": "We move!"}}],
+    "usage": {"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5},
+}
+
+@pytest.fixture
+def fake_provider(monkeypatch):
+    """Points provider 'fake' at an in-memory transport; returns the list of requests it received."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "HEAD":
+            return httpx.Response(200)
+        requests.append(request)
+        return httpx.Response(200, json=COMPLETION)
+
+    monkeypatch.setenv("FAKE_API_KEY", "test-key")
+    monkeypatch.setenv("CUSTOM_LLM_URL", "http://llm.test/v1")
+    monkeypatch.setattr(llm, "_new_http_client", lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    llm.reset_state()
+    yield requests
+    llm.reset_state()
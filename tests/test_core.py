@@ -1,4 +1,5 @@
 import asyncio
+import logging
 from agentic_hustler import Task, Hustle
 from pydantic import BaseModel
 
@@ -23,4 +24,5 @@ async def main():
     await hustle.start(Capital(), {"msg": "We Move!"})
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     asyncio.run(main())
\ No newline at end of file
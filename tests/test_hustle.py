@@ -0,0 +1,217 @@
+import gc
+import asyncio
+import httpx
+import openai
+import pytest
+from pydantic import BaseModel, ConfigDict
+from agentic_hustler import DockingStation, Task, Hustle, RetryPolicy, core
+
+class Boom(Task):
+    async def run_am(self, specs):
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+class Slow(Task):
+    def __init__(self, log):
+        super().__init__()
+        self.log = log
+
+    async def run_am(self, specs):
+        try:
+            await asyncio.sleep(10)
+        finally:
+            self.log.append("slow cleanup")
+
+class FanOut(Task):
+    def deliver_am(self, station, specs, output):
+        for route in self._connections:
+            self.next_task(route)
+
+def test_failing_branch_cancels_and_awaits_stragglers(caplog):
+    log = []
+    fan = FanOut()
+    fan.link("a", Boom())
+    fan.link("b", Boom())
+    fan.link("slow", Slow(log))
+
+    async def main():
+        with pytest.raises(ValueError, match="boom"):
+            await Hustle(fan).start({}, {})
+        log.append("start raised")
+
+    asyncio.run(main())
+    gc.collect()
+    assert log == ["slow cleanup", "start raised"]
+    assert "never retrieved" not in caplog.text
+
+class Flaky(Task):
+    def __init__(self, failures):
+        super().__init__()
+        self.failures = failures
+        self.calls = 0
+
+    async def run_am(self, specs):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise ConnectionError("flaky")
+        return specs
+
+def test_retry_policy_set_on_instance_is_used():
+    task = Flaky(failures=1)
+    task.retry_policy = RetryPolicy(retries=2, base_delay=0)
+    asyncio.run(Hustle(task).start({}, {}))
+    assert task.calls == 2
+
+def test_retry_policy_changed_later_is_picked_up():
+    class Once(Flaky):
+        retry_policy = RetryPolicy(retries=1, base_delay=0)
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(Hustle(Once(failures=1)).start({}, {}))
+
+    Once.retry_policy = RetryPolicy(retries=2, base_delay=0)
+    task = Once(failures=1)
+    asyncio.run(Hustle(task).start({}, {}))
+    assert task.calls == 2
+
+class Nap(Task):
+    async def run_am(self, specs):
+        await asyncio.sleep(0.01)
+        return specs
+
+def test_hustle_can_be_reused_across_event_loops():
+    fan = FanOut()
+    for route in ("a", "b", "c"):
+        fan.link(route, Nap())
+    hustle = Hustle(fan, max_concurrency=1)
+
+    asyncio.run(hustle.start({}, {}))
+    asyncio.run(hustle.start({}, {}))
+
+class Gatekeeper(Task):
+    async def run_am(self, specs):
+        self.next_task("reject")
+        return specs
+
+class Recorder(Task):
+    def __init__(self, seen, name):
+        super().__init__()
+        self.seen, self.name = seen, name
+
+    async def run_am(self, specs):
+        self.seen.append(self.name)
+
+def test_next_task_called_in_run_am_is_routed():
+    seen = []
+    gate = Gatekeeper()
+    gate.link("forward", Recorder(seen, "forward"))
+    gate.link("reject", Recorder(seen, "reject"))
+    asyncio.run(Hustle(gate).start({}, {}))
+    assert seen == ["reject"]
+
+class Throttled(Task):
+    def __init__(self, retry_after):
+        super().__init__()
+        self.retry_after = retry_after
+        self.calls = 0
+
+    async def run_am(self, specs):
+        self.calls += 1
+        if self.calls == 1:
+            response = httpx.Response(429, headers={"retry-after": self.retry_after}, request=httpx.Request("POST", "http://llm.test"))
+            raise openai.RateLimitError("slow down", response=response, body=None)
+        return specs
+
+@pytest.mark.parametrize("retry_after, expected", [("0", 0.0), ("3600", core.MAX_RETRY_AFTER)])
+def test_retry_after_is_honoured_and_capped(monkeypatch, retry_after, expected):
+    waits = []
+
+    async def fake_sleep(delay):
+        waits.append(delay)
+
+    monkeypatch.setattr(core.asyncio, "sleep", fake_sleep)
+    task = Throttled(retry_after)
+    task.retry_policy = RetryPolicy(retries=2, base_delay=30)
+    asyncio.run(Hustle(task).start({}, {}))
+    assert (task.calls, waits) == (2, [expected])
+
+class Step(Task):
+    def __init__(self, name, fan=1, record=False):
+        super().__init__()
+        self.name, self.fan, self.record = name, fan, record
+
+    def deliver_am(self, station, specs, output):
+        station.change["trail"].append(self.name)
+        if self.record:
+            station.capital.append((tuple(station.change["trail"]), station.change.get("branch")))
+        for branch in range(self.fan):
+            self.next_task(payload={"branch": branch} if self.fan > 1 else None)
+
+def run_chain(compiled):
+    first = Step("a")
+    first >> Step("b", fan=2) >> Step("c", record=True)
+    hustle = Hustle(first)
+    if compiled:
+        hustle.compile()
+        assert hustle._plan is not None
+    capital = []
+    asyncio.run(hustle.start(capital, {"trail": []}))
+    return sorted(capital)
+
+def test_compiled_plan_matches_the_router_through_a_runtime_fan_out():
+    expected = [(("a", "b", "c"), 0), (("a", "b", "c"), 1)]
+    assert run_chain(compiled=False) == expected
+    assert run_chain(compiled=True) == expected
+
+def test_compile_falls_back_to_the_router_for_named_routes():
+    fan = FanOut()
+    fan.link("a", Nap())
+    assert Hustle(fan).compile()._plan is None
+
+class Keep(Task):
+    def __init__(self, seen, name="keep"):
+        super().__init__()
+        self.seen, self.name = seen, name
+
+    def deliver_am(self, station, specs, output):
+        if isinstance(station.change, dict):
+            station.change["visits"].append(self.name)
+        self.seen.append(station.change)
+
+def test_single_successor_takes_the_change_without_copying():
+    seen = []
+    first = Nap()
+    first >> Keep(seen)
+    change = {"visits": []}
+    asyncio.run(Hustle(first).start({}, change))
+    assert seen[0] is change
+
+def test_fork_gives_each_branch_its_own_copy():
+    seen = []
+    fan = FanOut()
+    fan.link("a", Keep(seen, "a"))
+    fan.link("b", Keep(seen, "b"))
+    change = {"visits": []}
+    asyncio.run(Hustle(fan).start({}, change))
+    assert sorted(c["visits"] for c in seen) == [["a"], ["b"]]
+    assert change == {"visits": []}
+
+class Verdict(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    pitch: str
+    notes: tuple = ()
+
+def test_frozen_change_is_shared_across_a_fork():
+    seen = []
+    fan = FanOut()
+    fan.link("a", Keep(seen, "a"))
+    fan.link("b", Keep(seen, "b"))
+    change = Verdict(pitch="UberForCats")
+    asyncio.run(Hustle(fan).start({}, change))
+    assert [c is change for c in seen] == [True, True]
+
+def test_frozen_change_with_a_payload_gets_an_updated_copy():
+    change = Verdict(pitch="UberForCats")
+    station = DockingStation({}, change).undock({"notes": ("cats can't drive",)})
+    assert station.change == Verdict(pitch="UberForCats", notes=("cats can't drive",))
+    assert change.notes == ()
@@ -0,0 +1,240 @@
+import gc
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+import httpx
+import pytest
+from agentic_hustler import Task, UniversalLLM, aclose_clients, llm, no_gree
+
+MESSAGES = [{"role": "user", "content": "ping"}]
+
+def test_chat_works_across_separate_event_loops(fake_provider):
+    async def ask():
+        return await UniversalLLM("fake").chat(MESSAGES, "test-model")
+
+    assert asyncio.run(ask()) == "We move!"
+    assert asyncio.run(ask()) == "We move!"
+    assert len(fake_provider) == 2
+
+def test_contended_limits_work_across_event_loops(fake_provider, monkeypatch):
+    monkeypatch.setenv("LLM_MAX_CONCURRENCY", "1")
+    monkeypatch.setenv("LLM_RPM", "600")
+
+    async def ask_together():
+        llm = UniversalLLM("fake")
+        asks = [[{"role": "user", "content": f"Pitch {i}"}] for i in range(3)]
+        return await asyncio.gather(*(llm.chat(messages, "test-model", temperature=0) for messages in asks))
+
+    assert asyncio.run(ask_together()) == ["We move!"] * 3
+    assert asyncio.run(ask_together()) == ["We move!"] * 3
+
+def test_loop_scopes_are_closed_and_collected_with_their_loop(fake_provider, monkeypatch):
+    monkeypatch.setenv("LLM_MAX_CONCURRENCY", "1")
+    clients = []
+
+    async def ask_together():
+        adapter = UniversalLLM("fake")
+        clients.append(adapter.client._client)
+        asks = [[{"role": "user", "content": f"Pitch {i}"}] for i in range(3)]
+        return await asyncio.gather(*(adapter.chat(messages, "test-model") for messages in asks))
+
+    for _ in range(5):
+        asyncio.run(ask_together())
+    gc.collect()
+    assert len(llm._LOOP_SCOPES) == 0
+    assert all(client.is_closed for client in clients)
+
+def test_aclose_clients_releases_the_loop_clients(fake_provider):
+    async def ask_and_close():
+        llm = UniversalLLM("fake")
+        answer = await llm.chat(MESSAGES, "test-model")
+        first = llm.client
+        await aclose_clients()
+        # A fresh client is built on demand after closing
+        assert llm.client is not first
+        return answer
+
+    assert asyncio.run(ask_and_close()) == "We move!"
+
+def test_provider_key_set_after_first_adapter_is_found(fake_provider, monkeypatch):
+    UniversalLLM("fake")
+    monkeypatch.setenv("OPENAI_API_KEY", "late-key")
+    assert UniversalLLM("openai").api_key == "late-key"
+
+def test_araw_errors_are_retried_like_the_sdk_path(fake_provider, monkeypatch):
+    pytest.importorskip("aiohttp")
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+    from conftest import COMPLETION
+
+    statuses = [429, 503, 200]
+
+    async def completions(request):
+        status = statuses.pop(0)
+        if status != 200:
+            return web.json_response({"error": "slow down"}, status=status, headers={"retry-after": "0"})
+        return web.json_response(COMPLETION)
+
+    class FastPath(Task):
+        @no_gree(retries=3, base_delay=0)
+        async def run_am(self, specs):
+            return await UniversalLLM("fake").araw(MESSAGES, "test-model")
+
+    async def main():
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", completions)
+        server = TestServer(app)
+        await server.start_server()
+        monkeypatch.setenv("CUSTOM_LLM_URL", str(server.make_url("/v1")))
+        try:
+            data = await FastPath().run_am(None)
+        finally:
+            await UniversalLLM("fake").aclose()
+            await server.close()
+        return data
+
+    assert asyncio.run(main())["choices"][0]["message"]["content"] == "We move!"
+    assert statuses == []
+
+def test_cache_hit_does_not_call_the_client(fake_provider):
+    async def ask_twice():
+        llm = UniversalLLM("fake", cache=True)
+        return [await llm.chat(MESSAGES, "test-model") for _ in range(2)]
+
+    assert asyncio.run(ask_twice()) == ["We move!", "We move!"]
+    assert len(fake_provider) == 1
+
+def test_disk_cache_survives_a_new_adapter(fake_provider, tmp_path):
+    path = str(tmp_path / "answers")
+
+    async def ask():
+        return await UniversalLLM("fake", cache=True, cache_path=path).chat(MESSAGES, "test-model")
+
+    assert asyncio.run(ask()) == "We move!"
+    UniversalLLM._instances.clear()
+    assert asyncio.run(ask()) == "We move!"
+    assert len(fake_provider) == 1
+
+def test_dotenv_is_read_from_the_working_directory(fake_provider, monkeypatch, tmp_path):
+    (tmp_path / ".env").write_text("FAKE_API_KEY=from-dotenv\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("FAKE_API_KEY")
+    assert UniversalLLM("fake").api_key == "from-dotenv"
+
+def test_paths_outside_no_gree_keep_sdk_retries(fake_provider, monkeypatch):
+    calls = []
+
+    def flaky(request: httpx.Request) -> httpx.Response:
+        if request.method == "HEAD":
+            return httpx.Response(200)
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(503, headers={"retry-after-ms": "1"}, json={"error": {"message": "busy"}})
+        return httpx.Response(200, json={"choices": [{"index": 0, "text": "We move!"}]})
+
+    monkeypatch.setattr(llm, "_new_http_client", lambda: httpx.AsyncClient(transport=httpx.MockTransport(flaky)))
+
+    async def complete():
+        adapter = UniversalLLM("fake")
+        assert adapter._bare_client.max_retries == 0
+        return await adapter.complete_many(["Pitch"], "test-model")
+
+    assert asyncio.run(complete()) == ["We move!"]
+    assert len(calls) == 2
+
+def test_bind_forwards_request_params(fake_provider):
+    async def ask():
+        return await UniversalLLM("fake").bind(model="test-model", max_tokens=7, seed=1)(MESSAGES)
+
+    assert asyncio.run(ask()) == "We move!"
+    body = json.loads(fake_provider[0].content)
+    assert (body["max_tokens"], body["seed"]) == (7, 1)
+
+def test_cache_key_does_not_depend_on_orjson(monkeypatch):
+    messages = [{"role": "user", "content": "Café, s'il vous plaît"}]
+    with_extras = llm.ResponseCache.key("test-model", 1e-7, messages, {"seed": 1})
+    monkeypatch.setattr(llm, "orjson", None)
+    assert llm.ResponseCache.key("test-model", 1e-7, messages, {"seed": 1}) == with_extras
+    assert with_extras == "0f6ccb9a9824cc0a140d9ffe1b7ef068"
+
+def test_complete_many_rejects_n(fake_provider):
+    with pytest.raises(ValueError, match="n is not supported"):
+        asyncio.run(UniversalLLM("fake").complete_many(["p", "q"], "test-model", n=2))
+    assert fake_provider == []
+
+def test_unknown_provider_without_url_is_rejected(fake_provider, monkeypatch):
+    monkeypatch.delenv("CUSTOM_LLM_URL")
+    with pytest.raises(ValueError, match="CUSTOM_LLM_URL"):
+        UniversalLLM("fake")
+
+def test_batch_poll_sizes_results_without_request_counts(fake_provider, monkeypatch):
+    def answer(i, text):
+        return {"custom_id": str(i), "response": {"body": {"choices": [{"message": {"content": text}}]}}}
+
+    files = {
+        "out": [answer(0, "We move!"), answer(2, "Again!")],
+        "err": [{"custom_id": "3", "response": None, "error": {"message": "bad"}}],
+    }
+
+    def batches(request: httpx.Request) -> httpx.Response:
+        if request.method == "HEAD":
+            return httpx.Response(200)
+        if request.url.path.endswith("/content"):
+            file_id = request.url.path.split("/")[-2]
+            return httpx.Response(200, content="\n".join(json.dumps(row) for row in files[file_id]))
+        return httpx.Response(200, json={
+            "id": "batch_1", "object": "batch", "endpoint": "/v1/chat/completions",
+            "input_file_id": "in", "completion_window": "24h", "created_at": 0,
+            "status": "completed", "output_file_id": "out", "error_file_id": "err",
+            "request_counts": None,
+        })
+
+    monkeypatch.setattr(llm, "_new_http_client", lambda: httpx.AsyncClient(transport=httpx.MockTransport(batches)))
+    results = asyncio.run(UniversalLLM("fake").batch_poll("batch_1"))
+    assert results == ["We move!", None, "Again!", None]
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Freezes the limiter's clock; asyncio.sleep advances it instead of waiting. Yields the waits."""
+    now, waits = [1000.0], []
+
+    async def sleep(delay):
+        waits.append(delay)
+        now[0] += delay
+
+    monkeypatch.setattr(llm, "time", SimpleNamespace(monotonic=lambda: now[0], time=time.time))
+    monkeypatch.setattr(llm.asyncio, "sleep", sleep)
+    return waits
+
+def test_rate_limiter_paces_requests_and_tokens(fake_clock):
+    async def drain():
+        limiter = llm.RateLimiter(rpm=60, tpm=600)
+        for _ in range(3):
+            await limiter.acquire(300)
+
+    asyncio.run(drain())
+    # Two requests fit the full token bucket; the third waits for 300 tokens at 10/s
+    assert fake_clock == [30.0]
+
+def test_rate_limiter_waits_for_the_request_bucket(fake_clock):
+    async def drain():
+        limiter = llm.RateLimiter(rpm=60)
+        limiter.request_capacity = 0
+        await limiter.acquire()
+
+    asyncio.run(drain())
+    assert fake_clock == [1.0]
+
+def test_rate_limiter_clamps_to_provider_headers():
+    limiter = llm.RateLimiter(rpm=60, tpm=600)
+    limiter.sync_headers({"x-ratelimit-remaining-requests": "2", "x-ratelimit-remaining-tokens": "50"})
+    assert (limiter.request_capacity, limiter.token_capacity) == (2, 50)
+    # Never raised back above what the bucket already has
+    limiter.sync_headers({"x-ratelimit-remaining-requests": "100", "x-ratelimit-remaining-tokens": "bogus"})
+    assert (limiter.request_capacity, limiter.token_capacity) == (2, 50)
+
+def test_rate_limiter_settles_estimates_against_usage():
+    limiter = llm.RateLimiter(tpm=600)
+    limiter.settle({}, {"usage": {"total_tokens": 30}}, est_tokens=10)
+    assert limiter.token_capacity == 580